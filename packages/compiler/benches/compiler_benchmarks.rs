@@ -0,0 +1,84 @@
+//! Criterion benchmarks for the Cortex compiler
+//!
+//! Covers the three pipeline stages separately so regressions can be
+//! attributed: lexing, parsing, and interpretation. Criterion handles
+//! iteration-count amortization and statistical bounds, so single-shot
+//! wall-clock noise doesn't drown out small numeric changes.
+
+use criterion::{black_box, criterion_group, criterion_main, BatchSize, Criterion};
+use cortex_rust::{codegen::Interpreter, lexer::Lexer, parser::Parser as CortexParser};
+
+const FIBONACCI_SOURCE: &str = r#"
+    func fibonacci[n] |
+        if [n <= 1] |
+            return[n]
+        ^ else |
+            return[fibonacci[n - 1] + fibonacci[n - 2]]
+        ^
+    ^
+
+    let result := fibonacci[15]
+"#;
+
+const LOOP_SOURCE: &str = r#"
+    let total := 0
+    for i in 0..1000 |
+        let total := total + i * 2
+    ^
+"#;
+
+fn bench_lexer(c: &mut Criterion) {
+    c.bench_function("lex_fibonacci", |b| {
+        b.iter(|| {
+            let mut lexer = Lexer::new(black_box(FIBONACCI_SOURCE));
+            lexer.tokenize().unwrap()
+        })
+    });
+}
+
+fn bench_parser(c: &mut Criterion) {
+    let mut lexer = Lexer::new(FIBONACCI_SOURCE);
+    let tokens = lexer.tokenize().unwrap();
+
+    // The token clone is setup, not parsing — keep it outside the timed
+    // region so the measurement reflects parser throughput, not allocator
+    // behavior
+    c.bench_function("parse_fibonacci", |b| {
+        b.iter_batched(
+            || tokens.clone(),
+            |tokens| {
+                let mut parser = CortexParser::new(black_box(tokens));
+                parser.parse().unwrap()
+            },
+            BatchSize::SmallInput,
+        )
+    });
+}
+
+fn bench_interpreter(c: &mut Criterion) {
+    let parse = |source: &str| {
+        let mut lexer = Lexer::new(source);
+        let tokens = lexer.tokenize().unwrap();
+        let mut parser = CortexParser::new(tokens);
+        parser.parse().unwrap()
+    };
+
+    let fibonacci_ast = parse(FIBONACCI_SOURCE);
+    c.bench_function("interpret_fibonacci", |b| {
+        b.iter(|| {
+            let mut interpreter = Interpreter::new();
+            interpreter.interpret(black_box(&fibonacci_ast)).unwrap()
+        })
+    });
+
+    let loop_ast = parse(LOOP_SOURCE);
+    c.bench_function("interpret_numeric_loop", |b| {
+        b.iter(|| {
+            let mut interpreter = Interpreter::new();
+            interpreter.interpret(black_box(&loop_ast)).unwrap()
+        })
+    });
+}
+
+criterion_group!(benches, bench_lexer, bench_parser, bench_interpreter);
+criterion_main!(benches);
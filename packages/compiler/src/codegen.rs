@@ -5,6 +5,7 @@
 use crate::ast::*;
 use anyhow::Result;
 use std::collections::HashMap;
+use std::rc::Rc;
 
 #[derive(Debug, Clone, PartialEq)]
 pub enum Value {
@@ -78,7 +79,12 @@ impl std::fmt::Display for Value {
 /// ```
 pub struct Interpreter {
     variables: HashMap<String, Value>,
-    functions: HashMap<String, Function>,
+    /// Saved caller scopes, pushed on function entry and popped on exit.
+    /// Avoids cloning the entire variable map for every call.
+    scope_stack: Vec<HashMap<String, Value>>,
+    /// Function definitions are reference-counted so calls don't deep-clone
+    /// the function body out of the map.
+    functions: HashMap<String, Rc<Function>>,
     current_return_value: Option<Value>,
 }
 
@@ -95,6 +101,7 @@ impl Interpreter {
     pub fn new() -> Self {
         Self {
             variables: HashMap::new(),
+            scope_stack: Vec::new(),
             functions: HashMap::new(),
             current_return_value: None,
         }
@@ -180,7 +187,7 @@ impl Interpreter {
     
     fn interpret_function(&mut self, function: &Function) -> Result<()> {
         // Store function definition
-        self.functions.insert(function.name.clone(), function.clone());
+        self.functions.insert(function.name.clone(), Rc::new(function.clone()));
         Ok(())
     }
     
@@ -220,6 +227,29 @@ impl Interpreter {
     fn interpret_for_loop(&mut self, for_loop: &ForLoop) -> Result<()> {
         // Implement for loop with iterable support
         if let Some(iterable) = &for_loop.iterable {
+            // Range iterables step their bounds directly instead of going
+            // through interpret_expression, which would materialize the whole
+            // sequence as an array before the first iteration
+            if let Expression::Range(range_expr) = iterable {
+                let start = self.interpret_expression(&range_expr.start)?;
+                let end = self.interpret_expression(&range_expr.end)?;
+
+                if let (Value::Number(start_num), Value::Number(end_num)) = (start, end) {
+                    let mut index = 0usize;
+                    let mut current = start_num;
+                    while current < end_num {
+                        self.variables.insert(format!("{}_index", for_loop.variable), Value::Number(index as f64));
+                        self.variables.insert(for_loop.variable.clone(), Value::Number(current));
+                        self.interpret_block(&for_loop.body)?;
+                        current += 1.0;
+                        index += 1;
+                    }
+                    return Ok(());
+                } else {
+                    return Err(anyhow::anyhow!("Range expressions require numbers"));
+                }
+            }
+
             // Iterate over array or other iterable
             let iterable_value = self.interpret_expression(iterable)?;
             
@@ -332,7 +362,7 @@ impl Interpreter {
                 }
             }
             Expression::Identifier(identifier) => {
-                if let Some(value) = self.variables.get(&identifier.name) {
+                if let Some(value) = self.lookup_variable(&identifier.name) {
                     Ok(value.clone())
                 } else {
                     Err(anyhow::anyhow!("Undefined variable: {}", identifier.name))
@@ -340,8 +370,52 @@ impl Interpreter {
             }
             Expression::BinaryOp(binary_op) => {
                 let left = self.interpret_expression(&binary_op.left)?;
+
+                // Logical operators short-circuit: the right side is only
+                // evaluated when the left side hasn't already decided the result.
+                match binary_op.operator.as_str() {
+                    "&&" => {
+                        if !self.is_truthy(&left) {
+                            return Ok(Value::Boolean(false));
+                        }
+                        let right = self.interpret_expression(&binary_op.right)?;
+                        return Ok(Value::Boolean(self.is_truthy(&right)));
+                    }
+                    "||" => {
+                        if self.is_truthy(&left) {
+                            return Ok(Value::Boolean(true));
+                        }
+                        let right = self.interpret_expression(&binary_op.right)?;
+                        return Ok(Value::Boolean(self.is_truthy(&right)));
+                    }
+                    _ => {}
+                }
+
                 let right = self.interpret_expression(&binary_op.right)?;
-                
+
+                // Fast path for number operands: the helper functions below
+                // re-match on the value types, which is wasted work in the
+                // arithmetic-heavy inner loops where both sides are numbers.
+                if let (Value::Number(l), Value::Number(r)) = (&left, &right) {
+                    match binary_op.operator.as_str() {
+                        "+" => return Ok(Value::Number(l + r)),
+                        "-" => return Ok(Value::Number(l - r)),
+                        "*" => return Ok(Value::Number(l * r)),
+                        "/" if *r != 0.0 => return Ok(Value::Number(l / r)),
+                        "%" if *r != 0.0 => return Ok(Value::Number(l % r)),
+                        "**" => return Ok(Value::Number(l.powf(*r))),
+                        // Equality mirrors values_equal's epsilon comparison
+                        // so the fast path can't change comparison results
+                        "==" => return Ok(Value::Boolean((l - r).abs() < f64::EPSILON)),
+                        "!=" => return Ok(Value::Boolean((l - r).abs() >= f64::EPSILON)),
+                        "<" => return Ok(Value::Boolean(l < r)),
+                        "<=" => return Ok(Value::Boolean(l <= r)),
+                        ">" => return Ok(Value::Boolean(l > r)),
+                        ">=" => return Ok(Value::Boolean(l >= r)),
+                        _ => {}
+                    }
+                }
+
                 match binary_op.operator.as_str() {
                     "+" => self.add_values(&left, &right),
                     "-" => self.subtract_values(&left, &right),
@@ -355,8 +429,6 @@ impl Interpreter {
                     "<=" => self.compare_values(&left, &right, |a, b| a <= b),
                     ">" => self.compare_values(&left, &right, |a, b| a > b),
                     ">=" => self.compare_values(&left, &right, |a, b| a >= b),
-                    "&&" => Ok(Value::Boolean(self.is_truthy(&left) && self.is_truthy(&right))),
-                    "||" => Ok(Value::Boolean(self.is_truthy(&left) || self.is_truthy(&right))),
                     "@" => self.access_element(&left, &right),
                     _ => Err(anyhow::anyhow!("Unsupported binary operator: {}", binary_op.operator))
                 }
@@ -511,7 +583,7 @@ impl Interpreter {
             } */
             Expression::Array(array) => {
                 // Implement array support
-                let mut values = Vec::new();
+                let mut values = Vec::with_capacity(array.elements.len());
                 for element in &array.elements {
                     let value = self.interpret_expression(element)?;
                     values.push(value);
@@ -520,7 +592,7 @@ impl Interpreter {
             }
             Expression::Dictionary(dict) => {
                 // Implement dictionary support
-                let mut map = std::collections::HashMap::new();
+                let mut map = std::collections::HashMap::with_capacity(dict.pairs.len());
                 for (key, value) in &dict.pairs {
                     let key_value = self.interpret_expression(key)?;
                     let value_value = self.interpret_expression(value)?;
@@ -560,272 +632,294 @@ impl Interpreter {
                 // Check if this is a function call
                 if let Expression::Identifier(identifier) = &*index_expr.container {
                     // Check if this is a built-in function
-                    if identifier.name == "print" {
-                        // Handle print function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        println!("{}", value);
-                        Ok(Value::Null)
-                    } else if identifier.name == "str" {
-                        // Handle str function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        Ok(Value::String(value.to_string()))
-                    } else if identifier.name == "len" {
-                        // Handle len function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        let length = match value {
-                            Value::Array(arr) => arr.len(),
-                            Value::Dictionary(dict) => dict.len(),
-                            Value::String(s) => s.len(),
-                            Value::Null => return Err(anyhow::anyhow!("len() requires an argument - provide an array, dictionary, or string")),
-                            _ => return Err(anyhow::anyhow!("len() expects array, dictionary, or string, got {:?}", value)),
-                        };
-                        Ok(Value::Number(length as f64))
-                    } else if identifier.name == "push" {
-                        // Handle push function (array, value)
-                        let index_value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(args) = index_value {
-                            if args.len() != 2 {
-                                return Err(anyhow::anyhow!("push() expects exactly 2 arguments: array and value"));
-                            }
-                            let array = args[0].clone();
-                            let value = args[1].clone();
-                            if let Value::Array(mut arr) = array {
-                                arr.push(value);
-                                Ok(Value::Array(arr))
+                    match identifier.name.as_str() {
+                        "print" => {
+                            // Handle print function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            println!("{}", value);
+                            Ok(Value::Null)
+                        }
+                        "str" => {
+                            // Handle str function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            Ok(Value::String(value.to_string()))
+                        }
+                        "len" => {
+                            // Handle len function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            let length = match value {
+                                Value::Array(arr) => arr.len(),
+                                Value::Dictionary(dict) => dict.len(),
+                                Value::String(s) => s.len(),
+                                Value::Null => return Err(anyhow::anyhow!("len() requires an argument - provide an array, dictionary, or string")),
+                                _ => return Err(anyhow::anyhow!("len() expects array, dictionary, or string, got {:?}", value)),
+                            };
+                            Ok(Value::Number(length as f64))
+                        }
+                        "push" => {
+                            // Handle push function (array, value)
+                            let index_value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(args) = index_value {
+                                if args.len() != 2 {
+                                    return Err(anyhow::anyhow!("push() expects exactly 2 arguments: array and value"));
+                                }
+                                let array = args[0].clone();
+                                let value = args[1].clone();
+                                if let Value::Array(mut arr) = array {
+                                    arr.push(value);
+                                    Ok(Value::Array(arr))
+                                } else {
+                                    Err(anyhow::anyhow!("push() first argument must be an array"))
+                                }
                             } else {
-                                Err(anyhow::anyhow!("push() first argument must be an array"))
+                                Err(anyhow::anyhow!("push() expects array arguments"))
                             }
-                        } else {
-                            Err(anyhow::anyhow!("push() expects array arguments"))
                         }
-                    } else if identifier.name == "pop" {
-                        // Handle pop function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(mut arr) = value {
-                            if arr.is_empty() {
-                                Ok(Value::Null)
+                        "pop" => {
+                            // Handle pop function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(mut arr) = value {
+                                if arr.is_empty() {
+                                    Ok(Value::Null)
+                                } else {
+                                    Ok(arr.pop().unwrap())
+                                }
                             } else {
-                                Ok(arr.pop().unwrap())
+                                Err(anyhow::anyhow!("pop() expects an array"))
                             }
-                        } else {
-                            Err(anyhow::anyhow!("pop() expects an array"))
-                        }
-                    } else if identifier.name == "keys" {
-                        // Handle keys function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Dictionary(dict) = value {
-                            let keys: Vec<Value> = dict.keys().map(|k| Value::String(k.clone())).collect();
-                            Ok(Value::Array(keys))
-                        } else {
-                            Err(anyhow::anyhow!("keys() expects a dictionary"))
                         }
-                    } else if identifier.name == "values" {
-                        // Handle values function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Dictionary(dict) = value {
-                            let values: Vec<Value> = dict.values().cloned().collect();
-                            Ok(Value::Array(values))
-                        } else {
-                            Err(anyhow::anyhow!("values() expects a dictionary"))
+                        "keys" => {
+                            // Handle keys function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Dictionary(dict) = value {
+                                let keys: Vec<Value> = dict.keys().map(|k| Value::String(k.clone())).collect();
+                                Ok(Value::Array(keys))
+                            } else {
+                                Err(anyhow::anyhow!("keys() expects a dictionary"))
+                            }
                         }
-                    } else if identifier.name == "abs" {
-                        // Handle abs function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Number(n) = value {
-                            Ok(Value::Number(n.abs()))
-                        } else {
-                            Err(anyhow::anyhow!("abs() expects a number"))
+                        "values" => {
+                            // Handle values function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Dictionary(dict) = value {
+                                let values: Vec<Value> = dict.values().cloned().collect();
+                                Ok(Value::Array(values))
+                            } else {
+                                Err(anyhow::anyhow!("values() expects a dictionary"))
+                            }
                         }
-                    } else if identifier.name == "min" {
-                        // Handle min function
-                        let index_value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(args) = index_value {
-                            if args.is_empty() {
-                                return Err(anyhow::anyhow!("min() expects at least one argument"));
+                        "abs" => {
+                            // Handle abs function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Number(n) = value {
+                                Ok(Value::Number(n.abs()))
+                            } else {
+                                Err(anyhow::anyhow!("abs() expects a number"))
                             }
-                            let mut min_val = None;
-                            for arg in args {
-                                if let Value::Number(n) = arg {
-                                    match min_val {
-                                        None => min_val = Some(n),
-                                        Some(current_min) => {
-                                            if n < current_min {
-                                                min_val = Some(n);
+                        }
+                        "min" => {
+                            // Handle min function
+                            let index_value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(args) = index_value {
+                                if args.is_empty() {
+                                    return Err(anyhow::anyhow!("min() expects at least one argument"));
+                                }
+                                let mut min_val = None;
+                                for arg in args {
+                                    if let Value::Number(n) = arg {
+                                        match min_val {
+                                            None => min_val = Some(n),
+                                            Some(current_min) => {
+                                                if n < current_min {
+                                                    min_val = Some(n);
+                                                }
                                             }
                                         }
+                                    } else {
+                                        return Err(anyhow::anyhow!("min() expects all arguments to be numbers"));
                                     }
-                                } else {
-                                    return Err(anyhow::anyhow!("min() expects all arguments to be numbers"));
                                 }
+                                Ok(Value::Number(min_val.unwrap()))
+                            } else {
+                                Err(anyhow::anyhow!("min() expects array of numbers"))
                             }
-                            Ok(Value::Number(min_val.unwrap()))
-                        } else {
-                            Err(anyhow::anyhow!("min() expects array of numbers"))
                         }
-                    } else if identifier.name == "max" {
-                        // Handle max function
-                        let index_value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(args) = index_value {
-                            if args.is_empty() {
-                                return Err(anyhow::anyhow!("max() expects at least one argument"));
-                            }
-                            let mut max_val = None;
-                            for arg in args {
-                                if let Value::Number(n) = arg {
-                                    match max_val {
-                                        None => max_val = Some(n),
-                                        Some(current_max) => {
-                                            if n > current_max {
-                                                max_val = Some(n);
+                        "max" => {
+                            // Handle max function
+                            let index_value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(args) = index_value {
+                                if args.is_empty() {
+                                    return Err(anyhow::anyhow!("max() expects at least one argument"));
+                                }
+                                let mut max_val = None;
+                                for arg in args {
+                                    if let Value::Number(n) = arg {
+                                        match max_val {
+                                            None => max_val = Some(n),
+                                            Some(current_max) => {
+                                                if n > current_max {
+                                                    max_val = Some(n);
+                                                }
                                             }
                                         }
+                                    } else {
+                                        return Err(anyhow::anyhow!("max() expects all arguments to be numbers"));
                                     }
-                                } else {
-                                    return Err(anyhow::anyhow!("max() expects all arguments to be numbers"));
                                 }
+                                Ok(Value::Number(max_val.unwrap()))
+                            } else {
+                                Err(anyhow::anyhow!("max() expects array of numbers"))
                             }
-                            Ok(Value::Number(max_val.unwrap()))
-                        } else {
-                            Err(anyhow::anyhow!("max() expects array of numbers"))
                         }
-                    } else if identifier.name == "substring" {
-                        // Handle substring function (string, start, length)
-                        let index_value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(args) = index_value {
-                            if args.len() != 3 {
-                                return Err(anyhow::anyhow!("substring() expects exactly 3 arguments: string, start, length"));
-                            }
-                            if let (Value::String(s), Value::Number(start), Value::Number(length)) = (&args[0], &args[1], &args[2]) {
-                                let start_idx = *start as usize;
-                                let len = *length as usize;
-                                if start_idx >= s.len() {
-                                    Ok(Value::String(String::new()))
+                        "substring" => {
+                            // Handle substring function (string, start, length)
+                            let index_value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(args) = index_value {
+                                if args.len() != 3 {
+                                    return Err(anyhow::anyhow!("substring() expects exactly 3 arguments: string, start, length"));
+                                }
+                                if let (Value::String(s), Value::Number(start), Value::Number(length)) = (&args[0], &args[1], &args[2]) {
+                                    let start_idx = *start as usize;
+                                    let len = *length as usize;
+                                    if start_idx >= s.len() {
+                                        Ok(Value::String(String::new()))
+                                    } else {
+                                        let end_idx = (start_idx + len).min(s.len());
+                                        Ok(Value::String(s[start_idx..end_idx].to_string()))
+                                    }
                                 } else {
-                                    let end_idx = (start_idx + len).min(s.len());
-                                    Ok(Value::String(s[start_idx..end_idx].to_string()))
+                                    Err(anyhow::anyhow!("substring() expects string, number, number arguments"))
                                 }
                             } else {
-                                Err(anyhow::anyhow!("substring() expects string, number, number arguments"))
+                                Err(anyhow::anyhow!("substring() expects array of arguments"))
                             }
-                        } else {
-                            Err(anyhow::anyhow!("substring() expects array of arguments"))
                         }
-                    } else if identifier.name == "upper" {
-                        // Handle upper function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::String(s) = value {
-                            Ok(Value::String(s.to_uppercase()))
-                        } else {
-                            Err(anyhow::anyhow!("upper() expects a string"))
-                        }
-                    } else if identifier.name == "lower" {
-                        // Handle lower function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::String(s) = value {
-                            Ok(Value::String(s.to_lowercase()))
-                        } else {
-                            Err(anyhow::anyhow!("lower() expects a string"))
+                        "upper" => {
+                            // Handle upper function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::String(s) = value {
+                                Ok(Value::String(s.to_uppercase()))
+                            } else {
+                                Err(anyhow::anyhow!("upper() expects a string"))
+                            }
                         }
-                    } else if identifier.name == "split" {
-                        // Handle split function (string, delimiter)
-                        let index_value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Array(args) = index_value {
-                            if args.len() != 2 {
-                                return Err(anyhow::anyhow!("split() expects exactly 2 arguments: string, delimiter"));
+                        "lower" => {
+                            // Handle lower function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::String(s) = value {
+                                Ok(Value::String(s.to_lowercase()))
+                            } else {
+                                Err(anyhow::anyhow!("lower() expects a string"))
                             }
-                            if let (Value::String(s), Value::String(delimiter)) = (&args[0], &args[1]) {
-                                let parts: Vec<Value> = s.split(delimiter)
-                                    .map(|part| Value::String(part.to_string()))
-                                    .collect();
-                                Ok(Value::Array(parts))
+                        }
+                        "split" => {
+                            // Handle split function (string, delimiter)
+                            let index_value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Array(args) = index_value {
+                                if args.len() != 2 {
+                                    return Err(anyhow::anyhow!("split() expects exactly 2 arguments: string, delimiter"));
+                                }
+                                if let (Value::String(s), Value::String(delimiter)) = (&args[0], &args[1]) {
+                                    let parts: Vec<Value> = s.split(delimiter)
+                                        .map(|part| Value::String(part.to_string()))
+                                        .collect();
+                                    Ok(Value::Array(parts))
+                                } else {
+                                    Err(anyhow::anyhow!("split() expects string, string arguments"))
+                                }
                             } else {
-                                Err(anyhow::anyhow!("split() expects string, string arguments"))
+                                Err(anyhow::anyhow!("split() expects array of arguments"))
                             }
-                        } else {
-                            Err(anyhow::anyhow!("split() expects array of arguments"))
                         }
-                    } else if identifier.name == "sqrt" {
-                        // Handle sqrt function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Number(n) = value {
-                            if n < 0.0 {
-                                // Graceful handling: return null for sqrt of negative numbers
-                                Ok(Value::Null)
+                        "sqrt" => {
+                            // Handle sqrt function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Number(n) = value {
+                                if n < 0.0 {
+                                    // Graceful handling: return null for sqrt of negative numbers
+                                    Ok(Value::Null)
+                                } else {
+                                    Ok(Value::Number(n.sqrt()))
+                                }
                             } else {
-                                Ok(Value::Number(n.sqrt()))
+                                Err(anyhow::anyhow!("sqrt() expects a number"))
                             }
-                        } else {
-                            Err(anyhow::anyhow!("sqrt() expects a number"))
                         }
-                    } else if identifier.name == "floor" {
-                        // Handle floor function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Number(n) = value {
-                            Ok(Value::Number(n.floor()))
-                        } else {
-                            Err(anyhow::anyhow!("floor() expects a number"))
+                        "floor" => {
+                            // Handle floor function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Number(n) = value {
+                                Ok(Value::Number(n.floor()))
+                            } else {
+                                Err(anyhow::anyhow!("floor() expects a number"))
+                            }
                         }
-                    } else if identifier.name == "ceil" {
-                        // Handle ceil function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Number(n) = value {
-                            Ok(Value::Number(n.ceil()))
-                        } else {
-                            Err(anyhow::anyhow!("ceil() expects a number"))
+                        "ceil" => {
+                            // Handle ceil function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Number(n) = value {
+                                Ok(Value::Number(n.ceil()))
+                            } else {
+                                Err(anyhow::anyhow!("ceil() expects a number"))
+                            }
                         }
-                    } else if identifier.name == "round" {
-                        // Handle round function
-                        let value = self.interpret_expression(&index_expr.index)?;
-                        if let Value::Number(n) = value {
-                            Ok(Value::Number(n.round()))
-                        } else {
-                            Err(anyhow::anyhow!("round() expects a number"))
+                        "round" => {
+                            // Handle round function
+                            let value = self.interpret_expression(&index_expr.index)?;
+                            if let Value::Number(n) = value {
+                                Ok(Value::Number(n.round()))
+                            } else {
+                                Err(anyhow::anyhow!("round() expects a number"))
+                            }
                         }
-                    } else if self.variables.contains_key(&identifier.name) {
-                        // This is array/dictionary indexing - the identifier refers to a variable
-                        let container = self.interpret_expression(&index_expr.container)?;
-                        let index = self.interpret_expression(&index_expr.index)?;
-                        self.access_element(&container, &index)
-                    } else if self.functions.contains_key(&identifier.name) {
-                        // This is a user-defined function call
-                        let index_value = self.interpret_expression(&index_expr.index)?;
+                        _ => {
+                            if self.lookup_variable(&identifier.name).is_some() {
+                                // This is array/dictionary indexing - the identifier refers to a variable
+                                let container = self.interpret_expression(&index_expr.container)?;
+                                let index = self.interpret_expression(&index_expr.index)?;
+                                self.access_element(&container, &index)
+                            } else if self.functions.contains_key(&identifier.name) {
+                                // This is a user-defined function call
+                                let index_value = self.interpret_expression(&index_expr.index)?;
                         
-                        // Check if this is a function call with no arguments (index is null)
-                        if matches!(index_value, Value::Null) {
-                            // Function call with no arguments
-                            self.call_function(&identifier.name, vec![])
-                        } else if let Value::Array(ref arguments) = index_value {
-                            // Check if this is a multi-argument call or a single array argument
-                            // The key insight: if the index_expr.index is an Array expression,
-                            // it was parsed from comma-separated arguments (multi-arg call).
-                            // If the index_expr.index is an Identifier, it's a single array argument.
+                                // Check if this is a function call with no arguments (index is null)
+                                if matches!(index_value, Value::Null) {
+                                    // Function call with no arguments
+                                    self.call_function(&identifier.name, vec![])
+                                } else if let Value::Array(ref arguments) = index_value {
+                                    // Check if this is a multi-argument call or a single array argument
+                                    // The key insight: if the index_expr.index is an Array expression,
+                                    // it was parsed from comma-separated arguments (multi-arg call).
+                                    // If the index_expr.index is an Identifier, it's a single array argument.
                             
-                            match &*index_expr.index {
-                                Expression::Array(_) => {
-                                    // This was parsed from comma-separated arguments like add[10, 20]
-                                    // Treat as multi-argument call
-                                    self.call_function(&identifier.name, arguments.clone())
-                                }
-                                Expression::Identifier(_) => {
-                                    // This was parsed from a single identifier like bubble_sort[unsorted]
-                                    // Treat as single-argument call with array argument
-                                    self.call_function(&identifier.name, vec![index_value])
-                                }
-                                _ => {
-                                    // For other cases, treat as single-argument call
+                                    match &*index_expr.index {
+                                        Expression::Array(_) => {
+                                            // This was parsed from comma-separated arguments like add[10, 20]
+                                            // Treat as multi-argument call
+                                            self.call_function(&identifier.name, arguments.clone())
+                                        }
+                                        Expression::Identifier(_) => {
+                                            // This was parsed from a single identifier like bubble_sort[unsorted]
+                                            // Treat as single-argument call with array argument
+                                            self.call_function(&identifier.name, vec![index_value])
+                                        }
+                                        _ => {
+                                            // For other cases, treat as single-argument call
+                                            self.call_function(&identifier.name, vec![index_value])
+                                        }
+                                    }
+                                } else {
+                                    // Single argument function call
                                     self.call_function(&identifier.name, vec![index_value])
                                 }
+                            } else {
+                                // This is array/dictionary indexing - the identifier could refer to a variable that hasn't been declared yet
+                                // or it might be a typo. Try to access as variable first, let it fail naturally if undefined
+                                let container = self.interpret_expression(&index_expr.container)?;
+                                let index = self.interpret_expression(&index_expr.index)?;
+                                self.access_element(&container, &index)
                             }
-                        } else {
-                            // Single argument function call
-                            self.call_function(&identifier.name, vec![index_value])
                         }
-                    } else {
-                        // This is array/dictionary indexing - the identifier could refer to a variable that hasn't been declared yet
-                        // or it might be a typo. Try to access as variable first, let it fail naturally if undefined
-                        let container = self.interpret_expression(&index_expr.container)?;
-                        let index = self.interpret_expression(&index_expr.index)?;
-                        self.access_element(&container, &index)
                     }
                 } else {
                     // This is array/dictionary indexing
@@ -863,6 +957,14 @@ impl Interpreter {
         Ok(result)
     }
     
+    /// Looks up a variable in the current scope, falling back through the
+    /// saved caller scopes so functions can still read outer bindings.
+    fn lookup_variable(&self, name: &str) -> Option<&Value> {
+        self.variables
+            .get(name)
+            .or_else(|| self.scope_stack.iter().rev().find_map(|scope| scope.get(name)))
+    }
+
     fn call_function(&mut self, function_name: &str, arguments: Vec<Value>) -> Result<Value> {
         if let Some(function) = self.functions.get(function_name).cloned() {
             // Check argument count
@@ -875,30 +977,32 @@ impl Interpreter {
                 ));
             }
             
-            // Save current variables and return value
-            let old_variables = self.variables.clone();
-            let old_return_value = self.current_return_value.clone();
-            self.current_return_value = None;
-            
-            // Bind parameters to arguments
+            // Push the caller's scope instead of cloning it; reads fall back
+            // through the scope stack, so outer variables stay visible while
+            // local bindings are discarded on return.
+            let mut local_scope = HashMap::with_capacity(function.parameters.len());
             for (param, arg_value) in function.parameters.iter().zip(arguments.iter()) {
-                self.variables.insert(param.name.clone(), arg_value.clone());
+                local_scope.insert(param.name.clone(), arg_value.clone());
             }
-            
+            self.scope_stack.push(std::mem::replace(&mut self.variables, local_scope));
+            let old_return_value = self.current_return_value.take();
+
             // Execute function body
-            let result = self.interpret_block(&function.body)?;
-            
+            let result = self.interpret_block(&function.body);
+
+            // Restore the caller's scope even if the body errored
+            self.variables = self.scope_stack.pop().expect("scope stack underflow");
+            let result = result?;
+
             // Check if we have a return value
-            let final_result = if let Some(return_val) = &self.current_return_value {
-                return_val.clone()
+            let final_result = if let Some(return_val) = self.current_return_value.take() {
+                return_val
             } else {
                 result
             };
-            
-            // Restore old variables and return value
-            self.variables = old_variables;
+
             self.current_return_value = old_return_value;
-            
+
             Ok(final_result)
         } else {
             Err(anyhow::anyhow!("Undefined function: {}", function_name))
@@ -4,6 +4,7 @@
 //! Provides enhanced error reporting with source context and token classification.
 
 use logos::Logos;
+use std::borrow::Cow;
 use std::fmt;
 use crate::error::{CompilerError, DetailedError, ErrorContext};
 use crate::security::SecurityContext;
@@ -24,8 +25,8 @@ pub enum Token {
     // ================================
     // LITERALS
     // ================================
-    #[regex(r"[0-9]+(\.[0-9]+)?([eE][+-]?[0-9]+)?", |lex| lex.slice().to_string())]
-    Number(String),
+    #[regex(r"[0-9]+(\.[0-9]+)?([eE][+-]?[0-9]+)?", |lex| lex.slice().parse::<f64>().ok())]
+    Number(f64),
     
     #[regex(r#""([^"\\]|\\.)*""#, |lex| lex.slice().to_string())]
     String(String),
@@ -248,7 +249,7 @@ impl TokenInfo {
     }
     
     /// Returns the string representation of the token
-    pub fn as_string(&self) -> String {
+    pub fn as_string(&self) -> Cow<'static, str> {
         self.token.as_string()
     }
     
@@ -316,71 +317,71 @@ impl Token {
     }
     
     /// Returns the string representation of the token
-    pub fn as_string(&self) -> String {
+    pub fn as_string(&self) -> Cow<'static, str> {
         match self {
             // Literals
-            Token::Number(n) => n.clone(),
-            Token::String(s) => s.clone(),
-            Token::Identifier(i) => i.clone(),
+            Token::Number(n) => Cow::Owned(n.to_string()),
+            Token::String(s) => Cow::Owned(s.clone()),
+            Token::Identifier(i) => Cow::Owned(i.clone()),
             
             // Keywords
-            Token::Let => "let".to_string(),
-            Token::Func => "func".to_string(),
-            Token::If => "if".to_string(),
-            Token::Else => "else".to_string(),
-            Token::While => "while".to_string(),
-            Token::For => "for".to_string(),
-            Token::Return => "return".to_string(),
-            Token::True => "true".to_string(),
-            Token::False => "false".to_string(),
-            Token::Null => "null".to_string(),
-            Token::In => "in".to_string(),
+            Token::Let => Cow::Borrowed("let"),
+            Token::Func => Cow::Borrowed("func"),
+            Token::If => Cow::Borrowed("if"),
+            Token::Else => Cow::Borrowed("else"),
+            Token::While => Cow::Borrowed("while"),
+            Token::For => Cow::Borrowed("for"),
+            Token::Return => Cow::Borrowed("return"),
+            Token::True => Cow::Borrowed("true"),
+            Token::False => Cow::Borrowed("false"),
+            Token::Null => Cow::Borrowed("null"),
+            Token::In => Cow::Borrowed("in"),
             
             // Operators
-            Token::Plus => "+".to_string(),
-            Token::Minus => "-".to_string(),
-            Token::Multiply => "*".to_string(),
-            Token::Divide => "/".to_string(),
-            Token::Modulo => "%".to_string(),
-            Token::Power => "**".to_string(),
-            Token::Assign => ":=".to_string(),
-            Token::AssignConst => "::".to_string(),
-            Token::Equals => "==".to_string(),
-            Token::NotEquals => "!=".to_string(),
-            Token::LessThan => "<".to_string(),
-            Token::LessEqual => "<=".to_string(),
-            Token::GreaterThan => ">".to_string(),
-            Token::GreaterEqual => ">=".to_string(),
-            Token::And => "&&".to_string(),
-            Token::Or => "||".to_string(),
-            Token::Not => "!".to_string(),
-            Token::Range => "..".to_string(),
-            Token::DotProduct => "@".to_string(),
-            Token::Gradient => "∇".to_string(),
-            Token::Partial => "∂".to_string(),
+            Token::Plus => Cow::Borrowed("+"),
+            Token::Minus => Cow::Borrowed("-"),
+            Token::Multiply => Cow::Borrowed("*"),
+            Token::Divide => Cow::Borrowed("/"),
+            Token::Modulo => Cow::Borrowed("%"),
+            Token::Power => Cow::Borrowed("**"),
+            Token::Assign => Cow::Borrowed(":="),
+            Token::AssignConst => Cow::Borrowed("::"),
+            Token::Equals => Cow::Borrowed("=="),
+            Token::NotEquals => Cow::Borrowed("!="),
+            Token::LessThan => Cow::Borrowed("<"),
+            Token::LessEqual => Cow::Borrowed("<="),
+            Token::GreaterThan => Cow::Borrowed(">"),
+            Token::GreaterEqual => Cow::Borrowed(">="),
+            Token::And => Cow::Borrowed("&&"),
+            Token::Or => Cow::Borrowed("||"),
+            Token::Not => Cow::Borrowed("!"),
+            Token::Range => Cow::Borrowed(".."),
+            Token::DotProduct => Cow::Borrowed("@"),
+            Token::Gradient => Cow::Borrowed("∇"),
+            Token::Partial => Cow::Borrowed("∂"),
             
             // Delimiters
-            Token::LeftBracket => "[".to_string(),
-            Token::RightBracket => "]".to_string(),
-            Token::LeftBrace => "{".to_string(),
-            Token::RightBrace => "}".to_string(),
-            Token::LeftParen => "(".to_string(),
-            Token::RightParen => ")".to_string(),
-            Token::Pipe => "|".to_string(),
-            Token::Caret => "^".to_string(),
-            Token::Comma => ",".to_string(),
-            Token::Semicolon => ";".to_string(),
-            Token::Colon => ":".to_string(),
-            Token::Dot => ".".to_string(),
+            Token::LeftBracket => Cow::Borrowed("["),
+            Token::RightBracket => Cow::Borrowed("]"),
+            Token::LeftBrace => Cow::Borrowed("{"),
+            Token::RightBrace => Cow::Borrowed("}"),
+            Token::LeftParen => Cow::Borrowed("("),
+            Token::RightParen => Cow::Borrowed(")"),
+            Token::Pipe => Cow::Borrowed("|"),
+            Token::Caret => Cow::Borrowed("^"),
+            Token::Comma => Cow::Borrowed(","),
+            Token::Semicolon => Cow::Borrowed(";"),
+            Token::Colon => Cow::Borrowed(":"),
+            Token::Dot => Cow::Borrowed("."),
             
             // Special
-            Token::Newline => "\n".to_string(),
-            Token::Comment => "//".to_string(),
-            Token::MultiLineComment => "/*".to_string(),
-            Token::Whitespace => " ".to_string(),
+            Token::Newline => Cow::Borrowed("\n"),
+            Token::Comment => Cow::Borrowed("//"),
+            Token::MultiLineComment => Cow::Borrowed("/*"),
+            Token::Whitespace => Cow::Borrowed(" "),
             
             // Error
-            Token::Error => "ERROR".to_string(),
+            Token::Error => Cow::Borrowed("ERROR"),
         }
     }
     
@@ -497,6 +498,9 @@ pub struct Lexer<'a> {
     source: &'a str,
     lexer: logos::Lexer<'a, Token>,
     security: SecurityContext,
+    /// Byte offsets of the start of each line, precomputed once so that
+    /// token positions can be resolved without rescanning the source.
+    line_starts: Vec<usize>,
 }
 
 impl<'a> Lexer<'a> {
@@ -519,10 +523,20 @@ impl<'a> Lexer<'a> {
     
     /// Creates a new lexer with custom security configuration
     pub fn with_security(source: &'a str, security: SecurityContext) -> Self {
+        // Record where each line begins so position lookups are a binary
+        // search instead of a linear scan from the start of the source.
+        let mut line_starts = vec![0];
+        for (offset, byte) in source.bytes().enumerate() {
+            if byte == b'\n' {
+                line_starts.push(offset + 1);
+            }
+        }
+
         Self {
             source,
             lexer: Token::lexer(source),
             security,
+            line_starts,
         }
     }
     
@@ -545,8 +559,10 @@ impl<'a> Lexer<'a> {
     pub fn tokenize(&mut self) -> Result<Vec<TokenInfo>, DetailedError> {
         // Validate source size
         self.security.config.validate_source_size(self.source.len())?;
-        
-        let mut tokens = Vec::new();
+
+        // Cortex source averages a few bytes per token; reserving up front
+        // avoids repeated reallocation of the token vector on large files.
+        let mut tokens = Vec::with_capacity(self.source.len() / 4 + 16);
         
         while let Some(token) = self.lexer.next() {
             // Check token count limit
@@ -607,11 +623,11 @@ impl<'a> Lexer<'a> {
                 // Validate identifier length
                 self.security.config.validate_identifier_length(name.len(), line, column)?;
             }
-            Token::Number(n) => {
-                // Validate number string length (prevent extremely long numbers)
-                if n.len() > 1000 {
+            Token::Number(_) => {
+                // Validate number literal length (prevent extremely long numbers)
+                if length > 1000 {
                     return Err(DetailedError::new(CompilerError::SecurityError {
-                        message: format!("Number literal too long ({} characters)", n.len()),
+                        message: format!("Number literal too long ({} characters)", length),
                     }).with_context(ErrorContext::new(format!("Line {}", line))
                         .with_suggestion("Use scientific notation for very large numbers".to_string())
                         .with_help("Long number literals can cause performance issues".to_string())));
@@ -624,25 +640,12 @@ impl<'a> Lexer<'a> {
     
     /// Calculates line and column position from byte offset
     fn calculate_position(&self, byte_offset: usize) -> (usize, usize) {
-        let mut line = 1;
-        let mut column = 1;
-        let mut current_offset = 0;
-        
-        for ch in self.source.chars() {
-            if current_offset >= byte_offset {
-                break;
-            }
-            
-            if ch == '\n' {
-                line += 1;
-                column = 1;
-            } else {
-                column += 1;
-            }
-            
-            current_offset += ch.len_utf8();
-        }
-        
+        // Binary search the precomputed line starts for the containing line,
+        // then count characters only within that line for the column.
+        let line = self.line_starts.partition_point(|&start| start <= byte_offset);
+        let line_start = self.line_starts[line - 1];
+        let column = self.source[line_start..byte_offset].chars().count() + 1;
+
         (line, column)
     }
     
@@ -671,7 +674,7 @@ mod tests {
         assert_eq!(tokens[0].token, Token::Let);
         assert_eq!(tokens[1].token, Token::Identifier("x".to_string()));
         assert_eq!(tokens[2].token, Token::Assign);
-        assert_eq!(tokens[3].token, Token::Number("42".to_string()));
+        assert_eq!(tokens[3].token, Token::Number(42.0));
     }
     
     #[test]
@@ -681,13 +684,13 @@ mod tests {
         let tokens = lexer.tokenize().unwrap();
         
         let expected = vec![
-            Token::Number("1".to_string()),
+            Token::Number(1.0),
             Token::Plus,
-            Token::Number("2".to_string()),
+            Token::Number(2.0),
             Token::Multiply,
-            Token::Number("3".to_string()),
+            Token::Number(3.0),
             Token::Power,
-            Token::Number("4".to_string()),
+            Token::Number(4.0),
         ];
         
         let actual: Vec<Token> = tokens.into_iter().map(|t| t.token).collect();
@@ -764,7 +767,7 @@ mod tests {
     fn test_token_categories() {
         assert_eq!(Token::Let.category(), TokenCategory::Keyword);
         assert_eq!(Token::Plus.category(), TokenCategory::Operator);
-        assert_eq!(Token::Number("42".to_string()).category(), TokenCategory::Literal);
+        assert_eq!(Token::Number(42.0).category(), TokenCategory::Literal);
         assert_eq!(Token::LeftBracket.category(), TokenCategory::Delimiter);
         assert_eq!(Token::Newline.category(), TokenCategory::Special);
         assert_eq!(Token::Error.category(), TokenCategory::Error);
@@ -784,7 +787,7 @@ mod tests {
         assert!(!Token::Let.is_operator());
         
         // Literals
-        assert!(Token::Number("42".to_string()).is_literal());
+        assert!(Token::Number(42.0).is_literal());
         assert!(Token::String("hello".to_string()).is_literal());
         assert!(Token::Identifier("x".to_string()).is_literal());
         assert!(!Token::Let.is_literal());
@@ -831,7 +834,7 @@ mod tests {
         
         // Non-operators
         assert_eq!(Token::Let.precedence(), 0);
-        assert_eq!(Token::Number("42".to_string()).precedence(), 0);
+        assert_eq!(Token::Number(42.0).precedence(), 0);
     }
     
     #[test]
@@ -849,7 +852,7 @@ mod tests {
         
         // Non-operators
         assert!(!Token::Let.is_left_associative());
-        assert!(!Token::Number("42".to_string()).is_left_associative());
+        assert!(!Token::Number(42.0).is_left_associative());
     }
     
     #[test]
@@ -884,7 +887,7 @@ mod tests {
     fn test_token_as_string() {
         assert_eq!(Token::Let.as_string(), "let");
         assert_eq!(Token::Plus.as_string(), "+");
-        assert_eq!(Token::Number("42".to_string()).as_string(), "42");
+        assert_eq!(Token::Number(42.0).as_string(), "42");
         assert_eq!(Token::String("hello".to_string()).as_string(), "hello");
         assert_eq!(Token::Identifier("x".to_string()).as_string(), "x");
         assert_eq!(Token::LeftBracket.as_string(), "[");
@@ -13,10 +13,12 @@ mod ast;
 mod codegen;
 mod error;
 mod security;
+mod visitor;
 
 use lexer::Lexer;
 use parser::Parser as CortexParser;
 use codegen::Interpreter;
+use visitor::ConstantFolder;
 // use error::CompilerError;
 
 #[derive(Parser)]
@@ -156,12 +158,17 @@ fn check_file(input: &PathBuf) -> Result<()> {
 
 fn interpret_source(source: &str) -> Result<()> {
     // Parse the source code
-    let ast = parse_source(source)?;
-    
+    let mut ast = parse_source(source)?;
+
+    // Fold constant expressions once before execution so hot loops don't
+    // re-evaluate them on every iteration
+    let mut folder = ConstantFolder::new();
+    folder.fold_program(&mut ast);
+
     // Interpret the AST
     let mut interpreter = Interpreter::new();
     interpreter.interpret(&ast)?;
-    
+
     Ok(())
 }
 
@@ -198,75 +205,51 @@ fn format_file(input: &PathBuf, output: Option<PathBuf>, indent: usize) -> Resul
 }
 
 fn format_cortex_code(source: &str, indent_size: usize) -> String {
-    let lines: Vec<&str> = source.lines().collect();
-    let mut formatted_lines = Vec::new();
+    let mut formatted = String::with_capacity(source.len());
     let mut current_indent = 0;
-    
-    for line in lines {
+    let mut first_line = true;
+    // Indentation prefixes are sliced from one buffer that grows when a
+    // deeper nesting level is first reached, instead of allocating a fresh
+    // string of spaces for every line
+    let mut indent_buf = String::new();
+
+    for line in source.lines() {
+        if !first_line {
+            formatted.push('\n');
+        }
+        first_line = false;
+
         let trimmed = line.trim();
-        
+
         // Skip empty lines but preserve them
         if trimmed.is_empty() {
-            formatted_lines.push(String::new());
-            continue;
-        }
-        
-        // Handle comments
-        if trimmed.starts_with("//") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            continue;
-        }
-        
-        // Handle block comments
-        if trimmed.starts_with("/*") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            continue;
-        }
-        
-        // Handle function definitions
-        if trimmed.starts_with("func ") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            if trimmed.ends_with(" |") {
-                current_indent += 1;
-            }
             continue;
         }
-        
-        // Handle variable declarations
-        if trimmed.starts_with("let ") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            continue;
-        }
-        
-        // Handle control flow
-        if trimmed.starts_with("if ") || trimmed.starts_with("while ") || trimmed.starts_with("for ") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            if trimmed.ends_with(" |") {
-                current_indent += 1;
-            }
-            continue;
+
+        // A lone block ending dedents before the line is emitted
+        if trimmed == "^" && current_indent > 0 {
+            current_indent -= 1;
         }
-        
-        // Handle block endings
-        if trimmed == "^" {
-            if current_indent > 0 {
-                current_indent -= 1;
-            }
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            continue;
+
+        let indent_width = current_indent * indent_size;
+        while indent_buf.len() < indent_width {
+            indent_buf.push(' ');
         }
-        
-        // Handle return statements
-        if trimmed.starts_with("return") {
-            formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
-            continue;
+        formatted.push_str(&indent_buf[..indent_width]);
+        formatted.push_str(trimmed);
+
+        // Block headers (func/if/while/for ending in the pipe) indent what follows
+        let opens_block = (trimmed.starts_with("func ")
+            || trimmed.starts_with("if ")
+            || trimmed.starts_with("while ")
+            || trimmed.starts_with("for "))
+            && trimmed.ends_with(" |");
+        if opens_block {
+            current_indent += 1;
         }
-        
-        // Handle function calls and other statements
-        formatted_lines.push(format!("{}{}", " ".repeat(current_indent * indent_size), trimmed));
     }
-    
-    formatted_lines.join("\n")
+
+    formatted
 }
 
 fn parse_source(source: &str) -> Result<ast::Program> {
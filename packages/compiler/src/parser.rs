@@ -207,8 +207,13 @@ impl Parser {
     }
     
     fn advance(&mut self) -> Option<&TokenInfo> {
-        if !self.is_at_end() {
-            self.position += 1;
+        // Resolve the current token once: the end-of-input and error-token
+        // checks both read it, so going through is_at_end here would index
+        // into the token vector three times per advance
+        if let Some(current) = self.tokens.get(self.position) {
+            if !matches!(current.token, Token::Error) {
+                self.position += 1;
+            }
         }
         self.current_token()
     }
@@ -242,13 +247,13 @@ impl Parser {
     }
     
     fn parse_statement(&mut self) -> Result<Option<Statement>, DetailedError> {
-        // Skip comments and newlines
+        // Skip newlines (comments never reach the parser; logos drops them
+        // during tokenization)
         while let Some(current) = self.current_token() {
-            match &current.token {
-                Token::Comment | Token::MultiLineComment | Token::Newline => {
-                    self.advance();
-                }
-                _ => break,
+            if matches!(current.token, Token::Newline) {
+                self.advance();
+            } else {
+                break;
             }
         }
         
@@ -517,13 +522,12 @@ impl Parser {
         
         let mut statements = Vec::new();
         while !self.match_token(Token::Caret) {
-            // Skip comments and newlines
+            // Skip newlines (comments are dropped during tokenization)
             while let Some(current) = self.current_token() {
-                match &current.token {
-                    Token::Comment | Token::MultiLineComment | Token::Newline => {
-                        self.advance();
-                    }
-                    _ => break,
+                if matches!(current.token, Token::Newline) {
+                    self.advance();
+                } else {
+                    break;
                 }
             }
             
@@ -784,12 +788,8 @@ impl Parser {
         
         match &current.token {
             Token::Number(n) => {
-                let value = n.parse::<f64>()
-                    .map_err(|_| ParseError::InvalidSyntax {
-                        line: current.line,
-                        column: current.column,
-                        message: format!("Invalid number: {}", n),
-                    })?;
+                // Numbers are parsed to f64 at lex time, so no re-parse is needed here.
+                let value = *n;
                 self.advance();
                 Ok(Expression::Literal(Literal::new(LiteralValue::Number(value), "number".to_string())))
             }
@@ -414,6 +414,213 @@ impl ConstantFolder {
     pub fn was_optimized(&self) -> bool {
         self.optimized
     }
+
+    /// Folds constant expressions in the program in place.
+    ///
+    /// Rewrites binary and unary operations whose operands are literals into
+    /// the resulting literal (e.g. `2 + 3 * 4` becomes `14`), so later passes
+    /// and the interpreter see smaller expression trees.
+    pub fn fold_program(&mut self, program: &mut Program) {
+        for statement in &mut program.statements {
+            self.fold_statement(statement);
+        }
+        self.prune_statements(&mut program.statements);
+    }
+
+    fn fold_block(&mut self, block: &mut Block) {
+        for statement in &mut block.statements {
+            self.fold_statement(statement);
+        }
+        self.prune_statements(&mut block.statements);
+    }
+
+    /// Removes branches that folding proved dead: `if [true]` is replaced by
+    /// its then-block, `if [false]` by its else-block (or dropped), and
+    /// `while [false]` is dropped entirely.
+    fn prune_statements(&mut self, statements: &mut Vec<Statement>) {
+        let needs_pruning = statements.iter().any(|stmt| match stmt {
+            Statement::IfStatement(i) => Self::const_bool(&i.condition).is_some(),
+            Statement::WhileLoop(w) => Self::const_bool(&w.condition) == Some(false),
+            _ => false,
+        });
+        if !needs_pruning {
+            return;
+        }
+
+        let old_statements = std::mem::take(statements);
+        for stmt in old_statements {
+            match stmt {
+                Statement::IfStatement(if_statement)
+                    if Self::const_bool(&if_statement.condition).is_some() =>
+                {
+                    self.optimized = true;
+                    // Cortex has a single flat scope per function, so the
+                    // surviving branch can be spliced into the parent block
+                    if Self::const_bool(&if_statement.condition) == Some(true) {
+                        statements.extend(if_statement.then_block.statements);
+                    } else if let Some(else_block) = if_statement.else_block {
+                        statements.extend(else_block.statements);
+                    }
+                }
+                Statement::WhileLoop(while_loop)
+                    if Self::const_bool(&while_loop.condition) == Some(false) =>
+                {
+                    self.optimized = true;
+                }
+                other => statements.push(other),
+            }
+        }
+    }
+
+    fn const_bool(expr: &Expression) -> Option<bool> {
+        match expr {
+            Expression::Literal(Literal {
+                value: LiteralValue::Boolean(b),
+                ..
+            }) => Some(*b),
+            _ => None,
+        }
+    }
+
+    fn fold_statement(&mut self, stmt: &mut Statement) {
+        match stmt {
+            Statement::Function(f) => self.fold_block(&mut f.body),
+            Statement::IfStatement(i) => {
+                self.fold_expression(&mut i.condition);
+                self.fold_block(&mut i.then_block);
+                if let Some(else_block) = &mut i.else_block {
+                    self.fold_block(else_block);
+                }
+            }
+            Statement::WhileLoop(w) => {
+                self.fold_expression(&mut w.condition);
+                self.fold_block(&mut w.body);
+            }
+            Statement::ForLoop(f) => {
+                if let Some(iterable) = &mut f.iterable {
+                    self.fold_expression(iterable);
+                }
+                self.fold_block(&mut f.body);
+            }
+            Statement::ReturnStatement(r) => {
+                if let Some(value) = &mut r.value {
+                    self.fold_expression(value);
+                }
+            }
+            Statement::Assignment(a) => self.fold_expression(&mut a.value),
+            Statement::ConstantAssignment(c) => self.fold_expression(&mut c.value),
+            Statement::IndexAssignment(i) => {
+                self.fold_expression(&mut i.container);
+                self.fold_expression(&mut i.index);
+                self.fold_expression(&mut i.value);
+            }
+            Statement::Expression(e) => self.fold_expression(e),
+        }
+    }
+
+    fn fold_expression(&mut self, expr: &mut Expression) {
+        match expr {
+            Expression::BinaryOp(binary_op) => {
+                self.fold_expression(&mut binary_op.left);
+                self.fold_expression(&mut binary_op.right);
+
+                if let (Expression::Literal(left), Expression::Literal(right)) =
+                    (binary_op.left.as_ref(), binary_op.right.as_ref())
+                {
+                    if let Some(folded) = Self::fold_binary(&binary_op.operator, left, right) {
+                        *expr = Expression::Literal(folded);
+                        self.optimized = true;
+                    }
+                }
+            }
+            Expression::UnaryOp(unary_op) => {
+                self.fold_expression(&mut unary_op.operand);
+
+                if let Expression::Literal(operand) = unary_op.operand.as_ref() {
+                    if let Some(folded) = Self::fold_unary(&unary_op.operator, operand) {
+                        *expr = Expression::Literal(folded);
+                        self.optimized = true;
+                    }
+                }
+            }
+            Expression::Array(array) => {
+                for element in &mut array.elements {
+                    self.fold_expression(element);
+                }
+            }
+            Expression::Dictionary(dictionary) => {
+                for (key, value) in &mut dictionary.pairs {
+                    self.fold_expression(key);
+                    self.fold_expression(value);
+                }
+            }
+            Expression::Index(index) => {
+                // The container may name a function, so only the index is folded
+                self.fold_expression(&mut index.index);
+            }
+            Expression::Range(range) => {
+                self.fold_expression(&mut range.start);
+                self.fold_expression(&mut range.end);
+            }
+            Expression::Literal(_) | Expression::Identifier(_) => {}
+        }
+    }
+
+    fn fold_binary(operator: &str, left: &Literal, right: &Literal) -> Option<Literal> {
+        match (&left.value, &right.value) {
+            (LiteralValue::Number(l), LiteralValue::Number(r)) => match operator {
+                "+" => Some(Self::number_literal(l + r)),
+                "-" => Some(Self::number_literal(l - r)),
+                "*" => Some(Self::number_literal(l * r)),
+                // Division and modulo by zero are runtime errors, so leave them unfolded
+                "/" if *r != 0.0 => Some(Self::number_literal(l / r)),
+                "%" if *r != 0.0 => Some(Self::number_literal(l % r)),
+                "**" => Some(Self::number_literal(l.powf(*r))),
+                // Number equality uses the interpreter's epsilon comparison
+                // (values_equal) so folded comparisons match runtime results
+                "==" => Some(Self::boolean_literal((l - r).abs() < f64::EPSILON)),
+                "!=" => Some(Self::boolean_literal((l - r).abs() >= f64::EPSILON)),
+                "<" => Some(Self::boolean_literal(l < r)),
+                ">" => Some(Self::boolean_literal(l > r)),
+                "<=" => Some(Self::boolean_literal(l <= r)),
+                ">=" => Some(Self::boolean_literal(l >= r)),
+                _ => None,
+            },
+            (LiteralValue::Boolean(l), LiteralValue::Boolean(r)) => match operator {
+                "&&" => Some(Self::boolean_literal(*l && *r)),
+                "||" => Some(Self::boolean_literal(*l || *r)),
+                "==" => Some(Self::boolean_literal(l == r)),
+                "!=" => Some(Self::boolean_literal(l != r)),
+                _ => None,
+            },
+            (LiteralValue::String(l), LiteralValue::String(r)) => match operator {
+                "+" => Some(Literal::new(
+                    LiteralValue::String(format!("{}{}", l, r)),
+                    "string".to_string(),
+                )),
+                "==" => Some(Self::boolean_literal(l == r)),
+                "!=" => Some(Self::boolean_literal(l != r)),
+                _ => None,
+            },
+            _ => None,
+        }
+    }
+
+    fn fold_unary(operator: &str, operand: &Literal) -> Option<Literal> {
+        match (&operand.value, operator) {
+            (LiteralValue::Number(n), "-") => Some(Self::number_literal(-n)),
+            (LiteralValue::Boolean(b), "!") => Some(Self::boolean_literal(!b)),
+            _ => None,
+        }
+    }
+
+    fn number_literal(value: f64) -> Literal {
+        Literal::new(LiteralValue::Number(value), "number".to_string())
+    }
+
+    fn boolean_literal(value: bool) -> Literal {
+        Literal::new(LiteralValue::Boolean(value), "boolean".to_string())
+    }
 }
 
 impl Visitor<bool> for ConstantFolder {
@@ -622,7 +829,116 @@ mod tests {
         // Should detect constant folding opportunities
         assert!(constant_folder.was_optimized());
     }
-    
+
+    #[test]
+    fn test_constant_folder_transform() {
+        let source = "let x := 2 + 3 * 4";
+
+        let mut lexer = Lexer::new(source);
+        let tokens = lexer.tokenize().unwrap();
+        let mut parser = Parser::new(tokens);
+        let mut ast = parser.parse().unwrap();
+
+        let mut constant_folder = ConstantFolder::new();
+        constant_folder.fold_program(&mut ast);
+
+        assert!(constant_folder.was_optimized());
+
+        // The whole right-hand side should now be a single literal
+        match &ast.statements[0] {
+            Statement::Assignment(assignment) => match &assignment.value {
+                Expression::Literal(literal) => {
+                    assert_eq!(literal.value, LiteralValue::Number(14.0));
+                }
+                other => panic!("Expected folded literal, got {:?}", other),
+            },
+            other => panic!("Expected assignment, got {:?}", other),
+        }
+    }
+
+    #[test]
+    fn test_constant_folder_equality_matches_runtime() {
+        // values_equal compares numbers within f64::EPSILON, so folding must
+        // not answer a literal comparison more strictly than the interpreter
+        let source = "let x := 0.1 + 0.2 == 0.3";
+
+        let mut lexer = Lexer::new(source);
+        let tokens = lexer.tokenize().unwrap();
+        let mut parser = Parser::new(tokens);
+        let mut ast = parser.parse().unwrap();
+
+        let mut constant_folder = ConstantFolder::new();
+        constant_folder.fold_program(&mut ast);
+
+        match &ast.statements[0] {
+            Statement::Assignment(assignment) => match &assignment.value {
+                Expression::Literal(literal) => {
+                    assert_eq!(literal.value, LiteralValue::Boolean(true));
+                }
+                other => panic!("Expected folded literal, got {:?}", other),
+            },
+            other => panic!("Expected assignment, got {:?}", other),
+        }
+    }
+
+    #[test]
+    fn test_constant_folder_prunes_dead_branches() {
+        let source = r#"
+            if [1 > 2] |
+                let x := 1
+            ^ else |
+                let x := 2
+            ^
+            while [false] |
+                let y := 3
+            ^
+        "#;
+
+        let mut lexer = Lexer::new(source);
+        let tokens = lexer.tokenize().unwrap();
+        let mut parser = Parser::new(tokens);
+        let mut ast = parser.parse().unwrap();
+
+        let mut constant_folder = ConstantFolder::new();
+        constant_folder.fold_program(&mut ast);
+
+        assert!(constant_folder.was_optimized());
+
+        // Only the else-branch assignment should survive
+        assert_eq!(ast.statements.len(), 1);
+        match &ast.statements[0] {
+            Statement::Assignment(assignment) => {
+                assert_eq!(assignment.variable, "x");
+                assert!(matches!(
+                    &assignment.value,
+                    Expression::Literal(literal) if literal.value == LiteralValue::Number(2.0)
+                ));
+            }
+            other => panic!("Expected assignment, got {:?}", other),
+        }
+    }
+
+    #[test]
+    fn test_constant_folder_preserves_division_by_zero() {
+        let source = "let x := 1 / 0";
+
+        let mut lexer = Lexer::new(source);
+        let tokens = lexer.tokenize().unwrap();
+        let mut parser = Parser::new(tokens);
+        let mut ast = parser.parse().unwrap();
+
+        let mut constant_folder = ConstantFolder::new();
+        constant_folder.fold_program(&mut ast);
+
+        // Division by zero must stay a runtime error, not fold to infinity
+        match &ast.statements[0] {
+            Statement::Assignment(assignment) => {
+                assert!(matches!(assignment.value, Expression::BinaryOp(_)));
+            }
+            other => panic!("Expected assignment, got {:?}", other),
+        }
+    }
+
     #[test]
     fn test_ast_printer() {
         let source = "let x := 42";
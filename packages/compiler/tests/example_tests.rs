@@ -0,0 +1,54 @@
+//! Example program tests for the Cortex compiler
+//!
+//! Every `.ctx` file shipped in `examples/` must lex and parse cleanly,
+//! so syntax regressions show up here before they reach users.
+
+use cortex_rust::{lexer::Lexer, parser::Parser as CortexParser};
+use std::fs;
+use std::path::PathBuf;
+
+fn examples_dir() -> PathBuf {
+    PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .join("../..")
+        .join("examples")
+}
+
+#[test]
+fn test_all_examples_parse() {
+    let mut example_files: Vec<PathBuf> = fs::read_dir(examples_dir())
+        .expect("examples directory should exist")
+        .filter_map(|entry| entry.ok())
+        .map(|entry| entry.path())
+        .filter(|path| path.extension().map_or(false, |ext| ext == "ctx"))
+        .collect();
+    example_files.sort();
+
+    assert!(!example_files.is_empty(), "no .ctx examples found");
+
+    let mut failures = Vec::new();
+    for path in &example_files {
+        let source = fs::read_to_string(path)
+            .unwrap_or_else(|e| panic!("failed to read {}: {}", path.display(), e));
+
+        let mut lexer = Lexer::new(&source);
+        let tokens = match lexer.tokenize() {
+            Ok(tokens) => tokens,
+            Err(e) => {
+                failures.push(format!("{}: lexer error: {}", path.display(), e));
+                continue;
+            }
+        };
+
+        let mut parser = CortexParser::new(tokens);
+        if let Err(e) = parser.parse() {
+            failures.push(format!("{}: parse error: {}", path.display(), e));
+        }
+    }
+
+    assert!(
+        failures.is_empty(),
+        "{} example(s) failed to parse:\n{}",
+        failures.len(),
+        failures.join("\n")
+    );
+}
@@ -187,6 +187,54 @@ fn test_logical_operators() {
     assert!(run_cortex_code(source).is_ok());
 }
 
+#[test]
+fn test_number_equality_uses_epsilon() {
+    // 0.1 + 0.2 differs from 0.3 only by floating-point rounding, which
+    // values_equal treats as equal — the number fast path must agree
+    let source = r#"
+        let a := 0.1
+        let b := 0.2
+        if [a + b == 0.3] |
+            let ok := 1
+        ^ else |
+            boom[1]
+        ^
+    "#;
+
+    assert!(run_cortex_code(source).is_ok());
+}
+
+#[test]
+fn test_short_circuit_and_skips_right_side() {
+    // The right side would be a runtime error (undefined function),
+    // but a false left side must prevent it from being evaluated
+    let source = r#"
+        let a := false && boom[1]
+    "#;
+
+    assert!(run_cortex_code(source).is_ok());
+}
+
+#[test]
+fn test_short_circuit_or_skips_right_side() {
+    let source = r#"
+        let a := true || boom[1]
+    "#;
+
+    assert!(run_cortex_code(source).is_ok());
+}
+
+#[test]
+fn test_logical_operators_still_evaluate_right_side_when_needed() {
+    // When the left side doesn't decide the result, the right side runs
+    // and its errors surface as usual
+    let source = r#"
+        let a := true && boom[1]
+    "#;
+
+    assert!(run_cortex_code(source).is_err());
+}
+
 #[test]
 fn test_nested_function_calls() {
     let source = r#"
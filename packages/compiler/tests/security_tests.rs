@@ -4,7 +4,7 @@
 //! and resource constraints.
 
 use cortex_rust::{
-    lexer::{Lexer, Token},
+    lexer::Lexer,
     parser::Parser,
     security::{SecurityConfig, SecurityContext},
 };